@@ -6,9 +6,12 @@ Usage:
     python analysis/run_analysis.py
 """
 
-import json
 import os
 import sys
+import time
+
+import orjson
+import pandas as pd
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,6 +21,46 @@ from analysis.sentiment import analyze_reviews, get_sentiment_summary
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 
+# Offline batch inference uses the OpenVINO-compiled model (CPU kernel fusion)
+BACKEND = "openvino"
+
+
+def parse_price(price) -> float:
+    """Parse a '$1,234.56' price string to a float, or 0.0 if it isn't one"""
+    try:
+        return float(str(price).replace('$', '').replace(',', ''))
+    except ValueError:
+        return 0.0
+
+
+def preprocess_products():
+    """Parse product prices once and store them as floats in products.json"""
+    products_path = os.path.join(DATA_DIR, 'products.json')
+    
+    try:
+        with open(products_path, 'rb') as f:
+            products = orjson.loads(f.read())
+    except FileNotFoundError:
+        print("No products found!")
+        return
+    
+    for product in products:
+        product['price_usd'] = parse_price(product.get('price'))
+    
+    with open(products_path, 'wb') as f:
+        f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
+    
+    print(f"Added parsed prices to {len(products)} products")
+
+
+def add_display_fields(review):
+    """Precompute the strings the app shows in the reviews table"""
+    review['confidence_pct'] = f"{review['confidence']:.1%}"
+    review['sentiment_display'] = (
+        f"✅ {review['sentiment']}" if review['sentiment'] == 'POSITIVE' else f"❌ {review['sentiment']}"
+    )
+    review['stars'] = '⭐' * int(review.get('rating') or 0)
+
 
 def run_analysis():
     """Run sentiment analysis on all reviews and save results"""
@@ -25,8 +68,8 @@ def run_analysis():
     
     # Load reviews
     print("Loading reviews...")
-    with open(reviews_path, 'r', encoding='utf-8') as f:
-        reviews = json.load(f)
+    with open(reviews_path, 'rb') as f:
+        reviews = orjson.loads(f.read())
     
     print(f"Loaded {len(reviews)} reviews")
     
@@ -39,22 +82,31 @@ def run_analysis():
     print("(This may take a moment on first run to download the model)")
     
     texts = tuple(r.get('text', '') for r in reviews)
-    sentiments = analyze_reviews(texts)
+    start = time.perf_counter()
+    sentiments = analyze_reviews(texts, BACKEND)
+    print(f"Analyzed {len(texts)} reviews in {time.perf_counter() - start:.2f}s")
     
-    # Add sentiment to each review
+    # Add sentiment to each review, counting positives in the same pass
+    positive = 0
     for i, review in enumerate(reviews):
         review['sentiment'] = sentiments[i]['label']
         review['confidence'] = sentiments[i]['score']
+        positive += review['sentiment'] == 'POSITIVE'
+        add_display_fields(review)
     
     # Save analyzed reviews
     output_path = os.path.join(DATA_DIR, 'reviews_analyzed.json')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(reviews, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(reviews, option=orjson.OPT_INDENT_2))
     
     print(f"\nSaved analyzed reviews to {output_path}")
     
+    # Also save as Parquet - the app loads this first (columnar, much faster than JSON)
+    parquet_path = os.path.join(DATA_DIR, 'reviews_analyzed.parquet')
+    pd.DataFrame(reviews).to_parquet(parquet_path, compression='zstd', index=False)
+    print(f"Saved analyzed reviews to {parquet_path}")
+    
     # Print summary
-    positive = sum(1 for r in reviews if r['sentiment'] == 'POSITIVE')
     negative = len(reviews) - positive
     
     print("\n" + "=" * 50)
@@ -66,4 +118,5 @@ def run_analysis():
 
 
 if __name__ == "__main__":
+    preprocess_products()
     run_analysis()
@@ -1,24 +1,193 @@
 """
 Sentiment Analysis module using HuggingFace Transformers
-Uses distilbert-base-uncased-finetuned-sst-2-english for classification
+Uses philschmid/tiny-bert-sst2-distilled (2-layer BERT distilled on SST-2) for classification
+The model is exported to ONNX and quantized to INT8 (or compiled to
+OpenVINO IR) for faster CPU inference
 """
 
-from transformers import pipeline
+import atexit
+import json
+import os
+
+
+def get_num_threads() -> int:
+    """Threads for intra-op parallelism: a valid OMP_NUM_THREADS if set, else every core"""
+    try:
+        threads = int(os.environ.get("OMP_NUM_THREADS", ""))
+    except ValueError:
+        threads = 0
+    return threads if threads > 0 else (os.cpu_count() or 1)
+
+
+# Use every core unless the user chose otherwise (env must be set before torch loads)
+NUM_THREADS = get_num_threads()
+os.environ.setdefault("OMP_NUM_THREADS", str(NUM_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(NUM_THREADS))
+
+import numpy as np
+import torch
+from transformers import AutoTokenizer, pipeline
 import streamlit as st
+import xxhash
+
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    # optimum not installed - fall back to the stock PyTorch pipeline
+    ORTModelForSequenceClassification = None
+
+try:
+    from optimum.intel import OVModelForSequenceClassification
+except ImportError:
+    # optimum-intel not installed - the "openvino" backend falls back to ONNX
+    OVModelForSequenceClassification = None
+
+torch.set_num_threads(NUM_THREADS)
+
+MODEL_NAME = "philschmid/tiny-bert-sst2-distilled"
+CACHE_DIR = "/tmp/transformers_cache"
+QUANTIZED_DIR = os.path.join(CACHE_DIR, "tiny-bert-sst2-onnx-int8")
+QUANTIZED_FILE = "model_quantized.onnx"
+OPENVINO_DIR = os.path.join(CACHE_DIR, "tiny-bert-sst2-openvino")
+OPENVINO_FILE = "openvino_model.xml"
+
+BATCH_SIZE = 32
+
+# Persistent cache of results keyed by backend tag + a hash of the (truncated)
+# review text, so scores from different backends/quantizations never mix
+SENTIMENT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'sentiment_cache.json'
+)
+SENTIMENT_CACHE_VERSION = 2  # Bumped when the key format changes
+
+# Backend -> cache tag (backend plus weight precision)
+BACKEND_TAGS = {
+    "openvino": "openvino-fp32",
+    "onnx": "onnx-int8",
+    "torch": "torch-fp32",
+}
+
+# Batches are padded to their longest input, so no fixed-length padding
+TOKENIZER_KWARGS = {"truncation": True}
+
+
+def load_cache() -> dict:
+    """Load cached sentiment results, discarding them if another model or key format produced them"""
+    try:
+        with open(SENTIMENT_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    
+    if cache.get("model") != MODEL_NAME or cache.get("version") != SENTIMENT_CACHE_VERSION:
+        return {}
+    return cache.get("results", {})
+
+
+def save_cache():
+    """Persist the sentiment cache to disk (registered to run at exit)"""
+    if not _cache:
+        return
+    os.makedirs(os.path.dirname(SENTIMENT_CACHE_PATH), exist_ok=True)
+    with open(SENTIMENT_CACHE_PATH, 'w', encoding='utf-8') as f:
+        json.dump({"model": MODEL_NAME, "version": SENTIMENT_CACHE_VERSION, "results": _cache}, f)
+
+
+_cache = load_cache()
+atexit.register(save_cache)
+
+
+def build_quantized_model():
+    """
+    Export the model to ONNX and quantize it to INT8 (dynamic quantization).
+    The artifact is cached in QUANTIZED_DIR so this only runs once.
+    """
+    print("Exporting model to ONNX and quantizing to INT8...")
+    onnx_model = ORTModelForSequenceClassification.from_pretrained(
+        MODEL_NAME, export=True, cache_dir=CACHE_DIR
+    )
+    quantizer = ORTQuantizer.from_pretrained(onnx_model)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=QUANTIZED_DIR, quantization_config=qconfig)
+    
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, cache_dir=CACHE_DIR)
+    tokenizer.save_pretrained(QUANTIZED_DIR)
+
+
+def build_openvino_model():
+    """
+    Export the model to OpenVINO IR for CPU-optimized inference.
+    The artifact is cached in OPENVINO_DIR so this only runs once.
+    """
+    print("Exporting model to OpenVINO IR...")
+    ov_model = OVModelForSequenceClassification.from_pretrained(
+        MODEL_NAME, export=True, cache_dir=CACHE_DIR
+    )
+    ov_model.save_pretrained(OPENVINO_DIR)
+    
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME, cache_dir=CACHE_DIR)
+    tokenizer.save_pretrained(OPENVINO_DIR)
+
+
+def resolve_backend(backend: str) -> str:
+    """Return the backend load_sentiment_model actually uses when asked for the given one"""
+    if backend == "openvino" and OVModelForSequenceClassification is not None:
+        return "openvino"
+    if backend == "torch" or ORTModelForSequenceClassification is None:
+        return "torch"
+    return "onnx"
 
 
 @st.cache_resource
-def load_sentiment_model():
+def load_sentiment_model(backend: str = "onnx"):
     """
     Load the sentiment analysis model with caching.
-    Uses @st.cache_resource to load the model only once.
+    Uses @st.cache_resource to load the model only once per backend.
+    
+    Args:
+        backend: "openvino" for the OpenVINO IR model (needs optimum-intel),
+            "onnx" for the INT8 ONNX model, "torch" for the compiled PyTorch
+            model. Falls back to PyTorch when optimum is not installed.
     """
     print("Loading sentiment analysis model...")
-    classifier = pipeline(
-        "sentiment-analysis",
-        model="distilbert-base-uncased-finetuned-sst-2-english",
-        device="cpu"  # Use CPU for compatibility with Render free tier
-    )
+    backend = resolve_backend(backend)
+    if backend == "openvino":
+        if not os.path.exists(os.path.join(OPENVINO_DIR, OPENVINO_FILE)):
+            build_openvino_model()
+        
+        classifier = pipeline(
+            "sentiment-analysis",
+            model=OVModelForSequenceClassification.from_pretrained(OPENVINO_DIR),
+            tokenizer=AutoTokenizer.from_pretrained(OPENVINO_DIR)
+        )
+    elif backend == "torch":
+        classifier = pipeline(
+            "sentiment-analysis",
+            model=MODEL_NAME,
+            device="cpu"  # Use CPU for compatibility with Render free tier
+        )
+        
+        # Compile the model so the forward pass runs as fused CPU kernels
+        # (dynamic shapes, since batch lengths vary)
+        classifier.model.eval()
+        classifier.model = torch.compile(classifier.model, dynamic=True)
+        
+        # Run a dummy input so the one-off compilation cost is paid at load
+        # time rather than on the first real batch
+        classifier(["Warming up the model."], **TOKENIZER_KWARGS)
+    else:
+        if not os.path.exists(os.path.join(QUANTIZED_DIR, QUANTIZED_FILE)):
+            build_quantized_model()
+        
+        classifier = pipeline(
+            "sentiment-analysis",
+            model=ORTModelForSequenceClassification.from_pretrained(
+                QUANTIZED_DIR, file_name=QUANTIZED_FILE
+            ),
+            tokenizer=AutoTokenizer.from_pretrained(QUANTIZED_DIR),
+            device="cpu"  # Use CPU for compatibility with Render free tier
+        )
     print("Model loaded successfully!")
     return classifier
 
@@ -39,40 +208,57 @@ def analyze_sentiment(text: str) -> dict:
     if len(text) > 512:
         text = text[:512]
     
-    result = classifier(text)[0]
+    result = classifier(text, **TOKENIZER_KWARGS)[0]
     return {
-        "label": result["label"],
+        "label": result["label"].upper(),  # Model emits lowercase labels
         "score": round(result["score"], 4)
     }
 
 
-@st.cache_data(ttl=3600)
-def analyze_reviews(texts: tuple) -> list:
+def analyze_reviews(texts: tuple, backend: str = "onnx") -> list:
     """
     Analyze sentiment of multiple texts.
-    Uses caching to avoid re-analyzing the same reviews.
+    Uses caching to avoid re-analyzing the same reviews: results are
+    stored per backend and text hash, so only texts this backend has not
+    scored yet go through the model.
     
     Args:
-        texts: Tuple of text strings to analyze (tuple for hashability)
+        texts: Sequence of text strings to analyze
+        backend: Inference backend passed to load_sentiment_model
         
     Returns:
         List of dicts with 'label' and 'score' for each text
     """
-    classifier = load_sentiment_model()
-    
     # Convert tuple back to list and truncate texts if too long
     truncated_texts = [t[:512] if len(t) > 512 else t for t in texts]
+    tag = BACKEND_TAGS[resolve_backend(backend)]
+    keys = [f"{tag}:{xxhash.xxh64_hexdigest(t.encode('utf-8'))}" for t in truncated_texts]
     
-    # Process in batches for efficiency
-    results = classifier(truncated_texts)
+    # Collect unseen texts (each distinct text only once)
+    pending = {}
+    for key, text in zip(keys, truncated_texts):
+        if key not in _cache:
+            pending.setdefault(key, text)
     
-    return [
-        {
-            "label": r["label"],
-            "score": round(r["score"], 4)
-        }
-        for r in results
-    ]
+    if pending:
+        classifier = load_sentiment_model(backend)
+        pending_keys = list(pending)
+        pending_texts = list(pending.values())
+        
+        # Sort by length so each batch holds similar-length texts and
+        # padding to the batch maximum wastes little compute
+        order = sorted(range(len(pending_texts)), key=lambda i: len(pending_texts[i]))
+        sorted_results = classifier(
+            [pending_texts[i] for i in order], batch_size=BATCH_SIZE, **TOKENIZER_KWARGS
+        )
+        
+        for i, r in zip(order, sorted_results):
+            _cache[pending_keys[i]] = {
+                "label": r["label"].upper(),
+                "score": round(r["score"], 4)
+            }
+    
+    return [dict(_cache[key]) for key in keys]
 
 
 def get_sentiment_summary(sentiments: list) -> dict:
@@ -94,14 +280,15 @@ def get_sentiment_summary(sentiments: list) -> dict:
             "total": 0
         }
     
-    positive = [s for s in sentiments if s["label"] == "POSITIVE"]
-    negative = [s for s in sentiments if s["label"] == "NEGATIVE"]
+    n = len(sentiments)
+    is_positive = np.fromiter((s["label"] == "POSITIVE" for s in sentiments), dtype=bool, count=n)
+    scores = np.fromiter((s["score"] for s in sentiments), dtype=np.float64, count=n)
     
-    positive_count = len(positive)
-    negative_count = len(negative)
+    positive_count = int(is_positive.sum())
+    negative_count = n - positive_count
     
-    positive_avg_conf = sum(s["score"] for s in positive) / positive_count if positive_count > 0 else 0.0
-    negative_avg_conf = sum(s["score"] for s in negative) / negative_count if negative_count > 0 else 0.0
+    positive_avg_conf = float(scores[is_positive].mean()) if positive_count > 0 else 0.0
+    negative_avg_conf = float(scores[~is_positive].mean()) if negative_count > 0 else 0.0
     
     return {
         "positive_count": positive_count,
@@ -6,11 +6,13 @@ Modern UI with async scraping and dynamic month detection
 
 import streamlit as st
 import pandas as pd
-import json
+import orjson
+import ijson
 import os
+import re
 from collections import Counter
 import plotly.graph_objects as go
-from wordcloud import WordCloud
+from wordcloud import WordCloud, STOPWORDS
 import matplotlib.pyplot as plt
 
 # Page configuration
@@ -21,160 +23,36 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Modern CSS Styling
-st.markdown("""
-<style>
-    /* Hide stale/loading elements completely instead of graying out */
-    [data-stale="true"], .stale-element, .element-container[data-stale="true"] {
-        display: none !important;
-    }
-    
-    /* Or alternatively, just hide the opacity effect */
-    .main .block-container {
-        opacity: 1 !important;
-    }
-    
-    /* Disable Streamlit animations */
-    * {
-        transition: none !important;
-        animation: none !important;
-    }
-    
-    /* Main background and fonts */
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        background-attachment: fixed;
-    }
-    
-    .stApp {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-    }
-    
-    /* Header styling */
-    h1 {
-        background: linear-gradient(90deg, #667eea, #764ba2);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-weight: 800 !important;
-        font-size: 2.5rem !important;
-    }
-    
-    h2, h3 {
-        color: #4a5568 !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Card styling */
-    .product-card {
-        background: white;
-        border-radius: 15px;
-        padding: 20px;
-        margin: 10px 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        border-left: 4px solid #667eea;
-    }
-    
-    .product-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 15px rgba(0, 0, 0, 0.15);
-    }
-    
-    .testimonial-card {
-        background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-        border-radius: 15px;
-        padding: 20px;
-        margin: 10px 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        border-left: 4px solid #764ba2;
-    }
-    
-    /* Metric cards */
-    [data-testid="metric-container"] {
-        background: white;
-        border-radius: 10px;
-        padding: 15px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Sidebar styling */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #2c3e50 0%, #3d5a73 100%);
-    }
-    
-    [data-testid="stSidebar"] * {
-        color: white !important;
-    }
-    
-    [data-testid="stSidebar"] h1, [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3, 
-    [data-testid="stSidebar"] p, [data-testid="stSidebar"] span, [data-testid="stSidebar"] label {
-        color: white !important;
-        -webkit-text-fill-color: white !important;
-    }
-    
-    [data-testid="stSidebar"] .stRadio label {
-        color: white !important;
-    }
-    
-    [data-testid="stSidebar"] .stSlider label, 
-    [data-testid="stSidebar"] .stSlider span {
-        color: white !important;
-    }
-    
-    [data-testid="stSidebar"] button {
-        background: rgba(255,255,255,0.2) !important;
-        border: 1px solid rgba(255,255,255,0.3) !important;
-    }
-    
-    [data-testid="stSidebar"] button:hover {
-        background: rgba(255,255,255,0.3) !important;
-    }
-    
-    /* DataFrame styling */
-    .stDataFrame {
-        border-radius: 10px;
-        overflow: hidden;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(90deg, #667eea, #764ba2);
-        color: white;
-        border: none;
-        border-radius: 25px;
-        padding: 10px 30px;
-        font-weight: 600;
-        transition: transform 0.2s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: scale(1.05);
-    }
-    
-    /* Progress bar */
-    .stProgress > div > div {
-        background: linear-gradient(90deg, #667eea, #764ba2);
-    }
-    
-    /* Info boxes */
-    .stAlert {
-        border-radius: 10px;
-    }
-    
-    /* Scraping status */
-    .scraping-status {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 20px;
-        border-radius: 15px;
-        text-align: center;
-        margin: 20px 0;
-    }
-</style>
-""", unsafe_allow_html=True)
-
 # Constants
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+REVIEW_FIELDS = ('date', 'text', 'rating', 'sentiment', 'confidence',
+                 'stars', 'sentiment_display', 'confidence_pct')
+WORD_RE = re.compile(r"[A-Za-z]{3,}")
+MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Plotly layouts (built once, not on every rerun)
+RATING_CHART_LAYOUT = dict(
+    xaxis_title="Rating",
+    yaxis_title="Count",
+    height=300,
+    margin=dict(l=20, r=20, t=20, b=20)
+)
+SENTIMENT_CHART_LAYOUT = dict(
+    title='Sentiment Distribution (hover for confidence)',
+    height=300,
+    margin=dict(l=20, r=20, t=40, b=20),
+    showlegend=False,
+    yaxis_title="Number of Reviews"
+)
+
+
+@st.cache_data
+def load_css():
+    """Load the app stylesheet from static/app.css"""
+    with open(os.path.join(STATIC_DIR, 'app.css'), 'r', encoding='utf-8') as f:
+        return f.read()
 
 
 @st.cache_data(ttl=3600)
@@ -182,26 +60,43 @@ def load_products():
     """Load products data from JSON file"""
     filepath = os.path.join(DATA_DIR, 'products.json')
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         return []
 
 
+def stream_reviews(filepath):
+    """Stream-parse a reviews JSON file, keeping only the fields the app uses"""
+    with open(filepath, 'rb') as f:
+        return [
+            {k: review[k] for k in REVIEW_FIELDS if k in review}
+            for review in ijson.items(f, 'item', use_float=True)
+        ]
+
+
 @st.cache_data(ttl=3600)
 def load_reviews():
-    """Load pre-analyzed reviews from JSON file"""
-    # Try analyzed file first, fallback to raw reviews
+    """Load pre-analyzed reviews from Parquet or JSON file"""
+    # Try analyzed Parquet (columnar, fastest) then JSON, fallback to raw reviews
+    parquet_path = os.path.join(DATA_DIR, 'reviews_analyzed.parquet')
     analyzed_path = os.path.join(DATA_DIR, 'reviews_analyzed.json')
     raw_path = os.path.join(DATA_DIR, 'reviews.json')
     
     try:
-        with open(analyzed_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        df = pd.read_parquet(parquet_path)
+        records = df[[c for c in REVIEW_FIELDS if c in df.columns]].to_dict('records')
+        # Parquet fills missing values with NaN/None; drop them so absent fields
+        # stay absent, as they are when loading from JSON
+        return [{k: v for k, v in r.items() if not pd.isna(v)} for r in records]
+    except FileNotFoundError:
+        pass
+    
+    try:
+        return stream_reviews(analyzed_path)
     except FileNotFoundError:
         try:
-            with open(raw_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return stream_reviews(raw_path)
         except FileNotFoundError:
             return []
 
@@ -211,54 +106,61 @@ def load_testimonials():
     """Load testimonials data from JSON file"""
     filepath = os.path.join(DATA_DIR, 'testimonials.json')
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         return []
 
 
-def get_available_months(reviews):
-    """Extract all unique months from reviews and return sorted list"""
-    months = set()
-    for review in reviews:
-        date_str = review.get('date', '')
-        if date_str and len(date_str) >= 7:
-            month_key = date_str[:7]  # YYYY-MM format
-            months.add(month_key)
-    
-    # Sort months chronologically
-    sorted_months = sorted(list(months))
-    
-    # Create human-readable labels
-    month_names = {
-        '01': 'Jan', '02': 'Feb', '03': 'Mar', '04': 'Apr',
-        '05': 'May', '06': 'Jun', '07': 'Jul', '08': 'Aug',
-        '09': 'Sep', '10': 'Oct', '11': 'Nov', '12': 'Dec'
+def parse_price(price) -> float:
+    """Parse a '$1,234.56' price string to a float, or 0.0 if it isn't one"""
+    try:
+        return float(str(price).replace('$', '').replace(',', ''))
+    except ValueError:
+        return 0.0
+
+
+def get_review_months(reviews) -> tuple:
+    """Return the YYYY-MM key of each review ('' if undated) as a hashable tuple"""
+    return tuple((review.get('date') or '')[:7] for review in reviews)
+
+
+@st.cache_data(ttl=3600)
+def get_month_index(review_months: tuple) -> dict:
+    """Map each YYYY-MM key to the indices of the reviews from that month"""
+    index = {}
+    for i, month_key in enumerate(review_months):
+        index.setdefault(month_key, []).append(i)
+    return index
+
+
+def format_month(month_key: str) -> str:
+    """Turn a YYYY-MM key into a 'Mon YYYY' label, keeping the raw month if it isn't 01-12"""
+    month_num = month_key[5:7]
+    if month_num.isdigit() and 1 <= int(month_num) <= 12:
+        month_num = MONTH_NAMES[int(month_num) - 1]
+    return f"{month_num} {month_key[:4]}"
+
+
+@st.cache_data(ttl=3600)
+def get_available_months(review_months: tuple):
+    """Return sorted human-readable month labels and a label -> YYYY-MM map"""
+    # The month index already holds each distinct month once, so only those
+    # few keys are sorted (reviews are scraped newest-first, not chronologically)
+    month_map = {
+        format_month(month_key): month_key
+        for month_key in sorted(get_month_index(review_months))
+        if len(month_key) == 7
     }
-    
-    month_options = []
-    month_map = {}
-    
-    for month_key in sorted_months:
-        year = month_key[:4]
-        month_num = month_key[5:7]
-        label = f"{month_names.get(month_num, month_num)} {year}"
-        month_options.append(label)
-        month_map[label] = month_key
-    
-    return month_options, month_map
+    return list(month_map), month_map
 
 
-def filter_reviews_by_month(reviews: list, month_key: str) -> list:
-    """Filter reviews by the selected month"""
-    filtered = []
-    for review in reviews:
-        date_str = review.get('date', '')
-        if date_str.startswith(month_key):
-            filtered.append(review)
-    return filtered
+def filter_reviews_by_month(reviews: list, review_months: tuple, month_key: str) -> list:
+    """Filter reviews by the selected month using the cached month index"""
+    return [reviews[i] for i in get_month_index(review_months).get(month_key, [])]
 
 
+@st.fragment
 def display_products():
     """Display products section with modern cards"""
     st.markdown("## 🛍️ Products")
@@ -275,7 +177,11 @@ def display_products():
     with col1:
         st.metric("📦 Total Products", len(products))
     with col2:
-        prices = [float(p.get('price', '$0').replace('$', '')) for p in products if p.get('price')]
+        # price_usd is added by run_analysis.py; freshly scraped products only have the string
+        prices = [
+            p['price_usd'] if 'price_usd' in p else parse_price(p['price'])
+            for p in products if 'price_usd' in p or p.get('price')
+        ]
         avg_price = sum(prices) / len(prices) if prices else 0
         st.metric("💰 Average Price", f"${avg_price:.2f}")
     with col3:
@@ -300,6 +206,7 @@ def display_products():
             """, unsafe_allow_html=True)
 
 
+@st.fragment
 def display_testimonials():
     """Display testimonials section with modern cards"""
     st.markdown("## 💬 Testimonials")
@@ -337,12 +244,7 @@ def display_testimonials():
             textposition='auto'
         )
     ])
-    fig.update_layout(
-        xaxis_title="Rating",
-        yaxis_title="Count",
-        height=300,
-        margin=dict(l=20, r=20, t=20, b=20)
-    )
+    fig.update_layout(**RATING_CHART_LAYOUT)
     st.plotly_chart(fig, width='stretch')
     
     # Testimonials cards
@@ -361,8 +263,35 @@ def display_testimonials():
             """, unsafe_allow_html=True)
 
 
+@st.cache_data(ttl=3600)
+def get_word_frequencies(texts: tuple) -> Counter:
+    """Count the non-stopword words (3+ letters) across the given review texts"""
+    words = WORD_RE.findall(' '.join(texts).lower())
+    return Counter(w for w in words if w not in STOPWORDS)
+
+
+@st.cache_data(ttl=3600)
+def build_wordcloud(texts: tuple):
+    """Render a word cloud for the given review texts and return it as an image array"""
+    wordcloud = WordCloud(
+        width=1200,
+        height=400,
+        background_color='white',
+        colormap='plasma',
+        max_words=100,
+        min_font_size=12,
+        max_font_size=80,
+        random_state=42
+    ).generate_from_frequencies(get_word_frequencies(texts))
+    return wordcloud.to_array()
+
+
+@st.fragment
 def display_reviews():
-    """Display reviews section with sentiment analysis"""
+    """
+    Display reviews section with sentiment analysis.
+    Runs as a fragment, so moving the month slider only reruns this section.
+    """
     st.markdown("## 📝 Reviews & Sentiment Analysis")
     st.markdown("*Analyze customer reviews using Deep Learning (HuggingFace Transformers)*")
     
@@ -373,19 +302,22 @@ def display_reviews():
         return
     
     # Get available months dynamically
-    month_options, month_map = get_available_months(reviews)
+    review_months = get_review_months(reviews)
+    month_options, month_map = get_available_months(review_months)
     
     if not month_options:
         st.warning("No dated reviews found in the data.")
         return
     
-    # Get selected month from session state (set in main())
-    selected_month = st.session_state.get('selected_month', month_options[len(month_options) // 2])
-    month_map = st.session_state.get('month_map', month_map)
+    # Month filter (inside the fragment - fragments can't add sidebar widgets)
+    selected_month = st.select_slider(
+        "Month", options=month_options,
+        value=month_options[len(month_options) // 2], key="month_slider"
+    )
     
     # Filter reviews by selected month
     month_key = month_map.get(selected_month, '')
-    filtered_reviews = filter_reviews_by_month(reviews, month_key)
+    filtered_reviews = filter_reviews_by_month(reviews, review_months, month_key)
     
     # Metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -447,13 +379,7 @@ def display_reviews():
         customdata=[[summary['positive_avg_confidence']], [summary['negative_avg_confidence']]],
         hovertemplate='<b>%{x}</b><br>Count: %{y}<br>Avg Confidence: %{customdata[0]:.1%}<extra></extra>'
     ))
-    fig_bar.update_layout(
-        title='Sentiment Distribution (hover for confidence)',
-        height=300,
-        margin=dict(l=20, r=20, t=40, b=20),
-        showlegend=False,
-        yaxis_title="Number of Reviews"
-    )
+    fig_bar.update_layout(**SENTIMENT_CHART_LAYOUT)
     st.plotly_chart(fig_bar, width='stretch')
     
     # Word Cloud
@@ -461,19 +387,10 @@ def display_reviews():
     st.markdown("### ☁️ Word Cloud")
     st.markdown("*Visual representation of the most common words in reviews*")
     
-    all_text = ' '.join(review_texts)
-    
-    if all_text.strip():
-        wordcloud = WordCloud(
-            width=1200,
-            height=400,
-            background_color='white',
-            colormap='plasma',
-            max_words=100,
-            min_font_size=12,
-            max_font_size=80,
-            random_state=42
-        ).generate(all_text)
+    texts = tuple(review_texts)
+    if get_word_frequencies(texts):
+        # Cached per set of texts, so revisiting a month skips regeneration
+        wordcloud = build_wordcloud(texts)
         
         fig_wc, ax = plt.subplots(figsize=(12, 4))
         ax.imshow(wordcloud, interpolation='bilinear')
@@ -485,55 +402,52 @@ def display_reviews():
     st.markdown("---")
     st.markdown(f"### 📋 Reviews for {selected_month}")
     
+    # Display strings (stars, emoji labels, percentages) are precomputed by run_analysis.py;
+    # raw or older analyzed data lacks them, so they are formatted here instead
     df = pd.DataFrame(filtered_reviews)
-    display_columns = ['date', 'text', 'rating', 'sentiment', 'confidence']
-    df = df[[c for c in display_columns if c in df.columns]]
     
-    if 'confidence' in df.columns:
-        df['confidence'] = df['confidence'].apply(lambda x: f"{x:.1%}")
+    if 'confidence_pct' not in df.columns and 'confidence' in df.columns:
+        df['confidence_pct'] = df['confidence'].apply(lambda x: f"{x:.1%}")
     
-    if 'sentiment' in df.columns:
-        df['sentiment'] = df['sentiment'].apply(
+    if 'sentiment_display' not in df.columns and 'sentiment' in df.columns:
+        df['sentiment_display'] = df['sentiment'].apply(
             lambda x: f"✅ {x}" if x == "POSITIVE" else f"❌ {x}"
         )
     
-    if 'rating' in df.columns:
-        df['rating'] = df['rating'].apply(lambda x: '⭐' * int(x) if pd.notna(x) else '')
+    if 'stars' not in df.columns and 'rating' in df.columns:
+        df['stars'] = df['rating'].apply(lambda x: '⭐' * int(x) if pd.notna(x) else '')
+    
+    display_columns = {
+        'date': 'date',
+        'text': 'text',
+        'stars': 'rating',
+        'sentiment_display': 'sentiment',
+        'confidence_pct': 'confidence'
+    }
+    df = df[[c for c in display_columns if c in df.columns]].rename(columns=display_columns)
     
     st.dataframe(df, width='stretch', hide_index=True)
 
 
 def main():
     """Main application entry point"""
+    # Modern CSS Styling
+    st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
+    
     # Header
     st.markdown("# E-commerce Sentiment Analyzer")
     
     # Navigation
     page = st.sidebar.radio("Section", ["Reviews", "Products", "Testimonials"], index=0)
     
-    # Month filter for Reviews
-    reviews = load_reviews()
-    if page == "Reviews" and reviews:
-        month_options, month_map = get_available_months(reviews)
-        if month_options:
-            default_idx = len(month_options) // 2
-            selected_month = st.sidebar.select_slider(
-                "Month", options=month_options,
-                value=month_options[default_idx], key="month_slider_main"
-            )
-            st.session_state['selected_month'] = selected_month
-            st.session_state['month_map'] = month_map
-    
     # Compact stats
+    reviews = load_reviews()
     products = load_products()
     testimonials = load_testimonials()
     st.sidebar.caption(f"Data: {len(products)} products, {len(reviews)} reviews, {len(testimonials)} testimonials")
     
     # Display selected section - use container with key to prevent fade effect
-    selected_month = st.session_state.get('selected_month', '')
-    content_key = f"{page}_{selected_month}"
-    
-    with st.container(key=content_key):
+    with st.container(key=page):
         if page == "Products":
             display_products()
         elif page == "Testimonials":
@@ -0,0 +1,93 @@
+"""
+Shared headless Chromium setup for the Playwright-based scrapers
+One browser and context are launched and every scraper opens its own page
+in it, so several pages can be scraped concurrently
+"""
+
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+import asyncio
+import orjson
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.cache import USE_CACHE, page_cache_path
+
+# Resolve navigation once the DOM is ready instead of waiting for every
+# subresource; scrapers wait explicitly for the elements they need
+WAIT_UNTIL = "domcontentloaded"
+
+# Element lookups/actions fail fast instead of auto-waiting Playwright's default
+# 30s - every wait the scrapers rely on passes an explicit timeout
+DEFAULT_TIMEOUT_MS = 5000
+NAVIGATION_TIMEOUT_MS = 30000
+
+# Request types replayed from the on-disk cache (pages and their API calls)
+CACHED_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+
+
+async def fulfill_from_cache(route):
+    """Serve a GET request from the page cache, fetching and storing it on a miss"""
+    path = page_cache_path(route.request.url)
+    try:
+        with open(path + '.json', 'rb') as f:
+            meta = orjson.loads(f.read())
+        with open(path, 'rb') as f:
+            await route.fulfill(status=meta["status"], content_type=meta["content_type"], body=f.read())
+        return
+    except FileNotFoundError:
+        pass
+    
+    response = await route.fetch()
+    body = await response.body()
+    if response.status == 200:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(body)
+        with open(path + '.json', 'wb') as f:
+            f.write(orjson.dumps({
+                "status": response.status,
+                "content_type": response.headers.get("content-type", "text/html")
+            }))
+    await route.fulfill(response=response, body=body)
+
+
+async def handle_route(route):
+    """Abort image requests (only their URLs are scraped) and replay cached pages if enabled"""
+    request = route.request
+    if request.resource_type == "image":
+        await route.abort()
+    elif USE_CACHE and request.method == "GET" and request.resource_type in CACHED_RESOURCE_TYPES:
+        await fulfill_from_cache(route)
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def browser_context():
+    """Launch headless Chromium and yield a browser context that skips images"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=True,
+            args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu", "--disable-extensions"]
+        )
+        try:
+            context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+            context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+            context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+            await context.route("**/*", handle_route)
+            yield context
+        finally:
+            await browser.close()
+
+
+def run_in_browser(scrape):
+    """Run an async scrape(context) function in a fresh browser and return its result"""
+    async def runner():
+        async with browser_context() as context:
+            return await scrape(context)
+    
+    return asyncio.run(runner())
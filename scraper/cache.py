@@ -0,0 +1,38 @@
+"""
+On-disk response cache for repeated scraper runs during development
+Enabled by setting SCRAPE_CACHE=1; responses are stored under .scrape_cache/
+keyed by URL so later runs are served from disk instead of the network
+"""
+
+import hashlib
+import os
+
+import httpx
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(BASE_DIR, '.scrape_cache')
+USE_CACHE = os.environ.get("SCRAPE_CACHE") == "1"
+
+
+def get_http_client(**kwargs):
+    """Return an httpx.AsyncClient, wrapped in a file-backed cache when caching is enabled"""
+    if not USE_CACHE:
+        return httpx.AsyncClient(**kwargs)
+    
+    import hishel  # Optional dependency, only needed when caching is enabled
+    
+    return hishel.AsyncCacheClient(
+        storage=hishel.AsyncFileStorage(base_path=os.path.join(CACHE_DIR, 'http')),
+        controller=hishel.Controller(
+            allow_stale=True,
+            force_cache=True,  # Site doesn't send cache headers; cache anyway
+            cacheable_methods=["GET"],
+            cacheable_status_codes=[200]
+        ),
+        **kwargs
+    )
+
+
+def page_cache_path(url):
+    """Path of the cached body for a browser request to url"""
+    return os.path.join(CACHE_DIR, 'pages', hashlib.sha1(url.encode()).hexdigest())
@@ -0,0 +1,38 @@
+"""
+Streaming JSON writer shared by the scrapers
+Items are serialized one at a time as they are produced, so a scrape never
+has to hold the whole result list in memory before it is saved
+"""
+
+import orjson
+import os
+import tempfile
+
+
+def write_json_array(items, filepath):
+    """
+    Write an iterable of dicts to filepath as a JSON array, one item per line.
+    Items are streamed to a temp file next to filepath, which only replaces
+    filepath once the array is complete, so a failed run keeps the old file.
+    Returns the number of items written.
+    """
+    dirname = os.path.dirname(filepath)
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+    count = 0
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b'[')
+            for item in items:
+                f.write(b',\n' if count else b'\n')
+                f.write(orjson.dumps(item))
+                count += 1
+            f.write(b'\n]\n')
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files readable by the owner only
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return count
@@ -1,111 +1,113 @@
 """
-Products scraper for web-scraping.dev using Selenium
+Products scraper for web-scraping.dev using httpx + selectolax
 Scrapes product data from /products pages (6 pages total)
+The listing pages are server-rendered, so all pages are fetched concurrently
+over HTTP/2 and parsed directly - no browser needed
+Products are yielded lazily and streamed straight to disk by save_products
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import json
-import time
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin
+import asyncio
 import os
+import sys
 
-BASE_URL = "https://web-scraping.dev"
-PRODUCTS_URL = f"{BASE_URL}/products"
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from scraper.cache import get_http_client
+from scraper.output import write_json_array
 
-def get_driver():
-    """Create and return a Chrome WebDriver instance"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in headless mode
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+BASE_URL = "https://web-scraping.dev"
+PRODUCTS_URL = f"{BASE_URL}/products"
+NUM_PAGES = 6
 
 
-def scrape_products():
-    """Scrape all products from web-scraping.dev/products using Selenium"""
-    all_products = []
-    driver = get_driver()
-    
-    try:
-        # There are 6 pages of products
-        for page in range(1, 7):
-            print(f"Scraping products page {page}...")
-            
-            url = f"{PRODUCTS_URL}?page={page}"
-            driver.get(url)
+def parse_products(html):
+    """Yield every product card parsed from a products listing page"""
+    for product_node in LexborHTMLParser(html).css(".product"):
+        try:
+            # Extract product name from h3 > a
+            name_node = product_node.css_first("h3 a")
+            name = name_node.text().strip()
+            product_url = urljoin(BASE_URL, name_node.attributes.get("href", ""))
             
-            # Wait for page to load (with timeout handling)
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".product"))
-                )
-            except:
-                print(f"No products found on page {page}, skipping...")
-                continue
+            # Extract price from .price div
+            price_text = product_node.css_first(".price").text().strip()
+            price = f"${price_text}" if not price_text.startswith('$') else price_text
             
-            # Find all product elements
-            product_elements = driver.find_elements(By.CSS_SELECTOR, ".product")
+            # Extract description from .short-description
+            description = product_node.css_first(".short-description").text().strip()
             
-            for product_elem in product_elements:
-                try:
-                    # Extract product name from h3 > a
-                    name_elem = product_elem.find_element(By.CSS_SELECTOR, "h3 a")
-                    name = name_elem.text.strip()
-                    product_url = name_elem.get_attribute("href")
-                    
-                    # Extract price from .price div
-                    price_elem = product_elem.find_element(By.CSS_SELECTOR, ".price")
-                    price_text = price_elem.text.strip()
-                    price = f"${price_text}" if not price_text.startswith('$') else price_text
-                    
-                    # Extract description from .short-description
-                    desc_elem = product_elem.find_element(By.CSS_SELECTOR, ".short-description")
-                    description = desc_elem.text.strip()
-                    
-                    # Extract image
-                    img_elem = product_elem.find_element(By.CSS_SELECTOR, "img")
-                    image = img_elem.get_attribute("src")
-                    
-                    product = {
-                        "name": name,
-                        "url": product_url,
-                        "price": price,
-                        "description": description,
-                        "image": image
-                    }
-                    
-                    all_products.append(product)
-                    
-                except Exception as e:
-                    print(f"Error parsing product: {e}")
-                    continue
+            # Extract image
+            image = urljoin(BASE_URL, product_node.css_first("img").attributes.get("src", ""))
             
-            # Small delay between pages
-            time.sleep(0.5)
-            
-    finally:
-        driver.quit()
+            yield {
+                "name": name,
+                "url": product_url,
+                "price": price,
+                "description": description,
+                "image": image
+            }
+        
+        except Exception as e:
+            print(f"Error parsing product: {e}")
+            continue
+
+
+def iter_products(responses):
+    """Yield the products from each fetched listing page, skipping failed pages and duplicates"""
+    seen = set()
+    
+    for page, response in enumerate(responses, start=1):
+        print(f"Parsing products page {page}...")
+        
+        if isinstance(response, Exception) or response.status_code != 200:
+            print(f"Failed to load page {page}, skipping...")
+            continue
+        
+        for product in parse_products(response.text):
+            key = (product["name"], product["url"])
+            if key in seen:
+                continue  # Same product listed on more than one page
+            seen.add(key)
+            yield product
+
+
+async def fetch_products():
+    """
+    Fetch all product pages concurrently and return a generator of their
+    products, or None if every page failed to load
+    """
+    # All pages are requested at once and multiplexed over one HTTP/2 connection,
+    # so total wall time is roughly that of the slowest single page
+    async with get_http_client(http2=True, timeout=10) as client:
+        responses = await asyncio.gather(
+            *[client.get(PRODUCTS_URL, params={"page": page}) for page in range(1, NUM_PAGES + 1)],
+            return_exceptions=True
+        )
+    
+    if all(isinstance(r, Exception) or r.status_code != 200 for r in responses):
+        print("Failed to load any products page")
+        return None
     
-    return all_products
+    return iter_products(responses)
+
+
+def scrape_products():
+    """Scrape all products from web-scraping.dev/products"""
+    return asyncio.run(fetch_products())
 
 
 def save_products(products, filepath):
-    """Save products to JSON file"""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(products, f, indent=2, ensure_ascii=False)
-    print(f"Saved {len(products)} products to {filepath}")
+    """Stream products to a JSON file and return how many were saved"""
+    if products is None:
+        print(f"Scraping failed - keeping existing {filepath}")
+        return 0
+    
+    count = write_json_array(products, filepath)
+    print(f"Saved {count} products to {filepath}")
+    return count
 
 
 if __name__ == "__main__":
@@ -113,9 +115,8 @@ if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
     data_dir = os.path.join(os.path.dirname(script_dir), 'data')
     
-    products = scrape_products()
-    save_products(products, os.path.join(data_dir, 'products.json'))
+    num_products = save_products(scrape_products(), os.path.join(data_dir, 'products.json'))
     
     print(f"\n{'='*50}")
-    print(f"TOTAL PRODUCTS EXTRACTED: {len(products)}")
+    print(f"TOTAL PRODUCTS EXTRACTED: {num_products}")
     print(f"{'='*50}")
@@ -1,65 +1,107 @@
 """
-Reviews scraper for web-scraping.dev using Selenium
+Reviews scraper for web-scraping.dev using Playwright
 Scrapes review data from /reviews page with "Load More" pagination
 Reviews have dates in 2023 format (YYYY-MM-DD)
+Reviews are yielded lazily and streamed straight to disk by save_reviews
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-import json
-import time
+from selectolax.lexbor import LexborHTMLParser
 import os
 import re
+import sys
 from datetime import datetime
 from collections import Counter
 
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.browser import WAIT_UNTIL, run_in_browser
+from scraper.output import write_json_array
+
 BASE_URL = "https://web-scraping.dev"
 REVIEWS_URL = f"{BASE_URL}/reviews"
+REVIEW_YEAR = "2023"  # Only reviews from this year are kept
+DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
 
+# One full "Load More" round done inside the page, so each click costs a single
+# round-trip instead of separate visibility, click and review-count polls.
+# Waits for the button, clicks it (JS click for reliability) and resolves once
+# new reviews have been appended. Returns "done" when there is no button left
+# and "stalled" when clicking did not load anything new.
+LOAD_MORE_JS = """
+async ({buttonTimeout, loadTimeout}) => {
+    const until = async (predicate, timeout) => {
+        const deadline = Date.now() + timeout;
+        while (!predicate()) {
+            if (Date.now() > deadline) return false;
+            await new Promise(resolve => setTimeout(resolve, 50));
+        }
+        return true;
+    };
+    const button = () => {
+        const btn = document.querySelector('#page-load-more');
+        return btn && btn.offsetParent !== null ? btn : null;
+    };
+    const count = () => document.querySelectorAll('.review').length;
 
-def get_driver():
-    """Create and return a Chrome WebDriver instance"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in headless mode
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+    if (!await until(button, buttonTimeout)) return 'done';
+    const prev = count();
+    const btn = button();
+    btn.scrollIntoView(true);
+    btn.click();
+    return await until(() => count() > prev, loadTimeout) ? 'loaded' : 'stalled';
+}
+"""
+
+
+def extract_reviews(html):
+    """
+    Yield the raw fields of every review in the page HTML.
+    Parsing happens locally, so the browser is only asked for the HTML once.
+    Missing elements come back as None.
+    """
+    for review_node in LexborHTMLParser(html).css(".review"):
+        date_node = review_node.css_first("[data-testid='review-date']")
+        text_node = review_node.css_first("[data-testid='review-text'], .review-text, p")
+        stars = review_node.css("[data-testid='review-stars'] svg, .review-stars svg")
+        if not stars:
+            stars = review_node.css("svg")
+        
+        yield {
+            "full_text": review_node.text(separator=" ", strip=True),
+            "date": date_node.text().strip() if date_node else None,
+            "text": text_node.text().strip() if text_node else None,
+            "stars": len(stars)
+        }
 
 
 def parse_date(date_str):
     """Parse date string to standardized format"""
+    date_str = date_str.strip()
+    if DATE_RE.fullmatch(date_str):
+        return date_str  # Already YYYY-MM-DD
+    
     try:
         # Format: YYYY-MM-DD
-        dt = datetime.strptime(date_str.strip(), '%Y-%m-%d')
+        dt = datetime.strptime(date_str, '%Y-%m-%d')
         return dt.strftime('%Y-%m-%d')
     except ValueError:
         return date_str
 
 
-def scrape_reviews_selenium():
-    """Scrape reviews from web-scraping.dev/reviews using Selenium with Load More"""
-    all_reviews = []
-    driver = get_driver()
+async def scrape_reviews_playwright(context):
+    """
+    Load every review on web-scraping.dev/reviews in a new page of the given
+    browser context and return a snapshot of the page HTML.
+    """
+    page = await context.new_page()
     
     try:
         print("Navigating to reviews page...")
-        driver.get(REVIEWS_URL)
+        await page.goto(REVIEWS_URL, wait_until=WAIT_UNTIL)
         
         # Wait for reviews to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".review"))
-        )
+        await page.wait_for_selector(".review", timeout=10000)
         
         # Click "Load More" button multiple times to get all reviews
         max_clicks = 10  # Safety limit
@@ -67,104 +109,118 @@ def scrape_reviews_selenium():
         
         while click_count < max_clicks:
             try:
-                # Find and click the "Load More" button (id="page-load-more")
-                load_more_btn = WebDriverWait(driver, 3).until(
-                    EC.element_to_be_clickable((By.ID, "page-load-more"))
+                # Find the "Load More" button (id="page-load-more"), click it and
+                # wait for the new reviews - all in one call
+                status = await page.evaluate(
+                    LOAD_MORE_JS, {"buttonTimeout": 3000, "loadTimeout": 5000}
                 )
-                
-                # Scroll to button and click
-                driver.execute_script("arguments[0].scrollIntoView(true);", load_more_btn)
-                time.sleep(0.5)
-                driver.execute_script("arguments[0].click();", load_more_btn)  # JS click for reliability
-                click_count += 1
-                print(f"Clicked 'Load More' ({click_count} times)")
-                
-                # Wait for new content to load
-                time.sleep(1.5)
-                
-            except TimeoutException:
-                print("No more 'Load More' button found - all reviews loaded")
-                break
             except Exception as e:
                 print(f"Error clicking Load More: {e}")
                 break
+            
+            if status == "done":
+                print("No more 'Load More' button found - all reviews loaded")
+                break
+            
+            click_count += 1
+            print(f"Clicked 'Load More' ({click_count} times)")
+            
+            if status == "stalled":
+                print("No new reviews loaded - stopping")
+                break
         
-        # Now extract all reviews from the page
-        print("Extracting reviews from page...")
-        review_elements = driver.find_elements(By.CSS_SELECTOR, ".review")
-        print(f"Found {len(review_elements)} review elements")
-        
-        for review_elem in review_elements:
-            try:
-                # Get the full text of the review element
-                review_text = review_elem.text.strip()
+        # Take a single snapshot of the page HTML; reviews are parsed from it locally
+        return await page.content()
                 
-                # Extract date using the specific selector or regex fallback
-                try:
-                    date_elem = review_elem.find_element(By.CSS_SELECTOR, "[data-testid='review-date']")
-                    date = date_elem.text.strip()
-                except NoSuchElementException:
-                    # Fallback to regex
-                    date_match = re.search(r'(\d{4}-\d{2}-\d{2})', review_text)
-                    date = date_match.group(1) if date_match else None
-                
-                if not date:
-                    continue  # Skip reviews without dates
-                
-                # Extract review content using specific selector
-                try:
-                    text_elem = review_elem.find_element(By.CSS_SELECTOR, "[data-testid='review-text'], .review-text, p")
-                    text = text_elem.text.strip()
-                except NoSuchElementException:
-                    # Fallback: get text and remove the date part
-                    text = re.sub(r'\d{4}-\d{2}-\d{2}', '', review_text).strip()
-                
-                # Count stars - look for SVG elements in the review-stars span
-                star_svgs = review_elem.find_elements(By.CSS_SELECTOR, "[data-testid='review-stars'] svg, .review-stars svg")
-                if not star_svgs:
-                    # Fallback to any SVG in the review
-                    star_svgs = review_elem.find_elements(By.CSS_SELECTOR, "svg")
-                rating = len(star_svgs) if star_svgs else 5
+    finally:
+        await page.close()
+
+
+def parse_reviews(html):
+    """Yield a review dict for every distinct review element with meaningful text"""
+    seen = set()
+    found = 0
+    
+    for item in extract_reviews(html):
+        found += 1
+        try:
+            # Get the full text of the review element
+            review_text = item["full_text"]
+            
+            # Extract date using the specific selector or regex fallback
+            date = item["date"]
+            if date is None:
+                date_match = DATE_RE.search(review_text)
+                date = date_match.group(1) if date_match else None
+            
+            # Extract review content, falling back to the full text minus the date
+            text = item["text"]
+            if text is None:
+                text = DATE_RE.sub('', review_text).strip()
+            
+            # Star SVGs counted in extract_reviews
+            rating = item["stars"] or 5
+            
+            if text and len(text) > 10:  # Only add if there's meaningful text
+                key = (date, text)
+                if key in seen:
+                    continue  # Same review rendered twice
+                seen.add(key)
                 
-                if text and len(text) > 10:  # Only add if there's meaningful text
-                    review = {
-                        "text": text,
-                        "date": parse_date(date),
-                        "rating": rating
-                    }
-                    all_reviews.append(review)
-                    
-            except Exception as e:
-                print(f"Error parsing review: {e}")
-                continue
+                yield {
+                    "text": text,
+                    "date": parse_date(date) if date else None,
+                    "rating": rating
+                }
                 
-    finally:
-        driver.quit()
+        except Exception as e:
+            print(f"Error parsing review: {e}")
+            continue
     
-    return all_reviews
+    print(f"Found {found} review elements")
 
 
-def scrape_reviews():
-    """Main function to scrape reviews using Selenium - only 2023 reviews"""
-    reviews = []
+def filter_year(reviews):
+    """Yield only the reviews from REVIEW_YEAR; undated reviews are dropped too"""
+    kept = 0
+    
+    for review in reviews:
+        if review["date"] and review["date"].startswith(REVIEW_YEAR):
+            kept += 1
+            yield review
     
+    print(f"Kept {kept} reviews from {REVIEW_YEAR}")
+
+
+async def fetch_reviews(context):
+    """
+    Scrape reviews in the given browser context and return a generator of the
+    2023 ones, or None if scraping failed
+    """
     try:
-        all_reviews = scrape_reviews_selenium()
-        # Filter to only keep 2023 reviews
-        reviews = [r for r in all_reviews if r.get('date', '').startswith('2023')]
-        print(f"Scraped {len(all_reviews)} reviews, kept {len(reviews)} from 2023")
+        html = await scrape_reviews_playwright(context)
     except Exception as e:
-        print(f"Selenium scraping failed: {e}")
+        print(f"Playwright scraping failed: {e}")
+        return None
     
-    return reviews
+    # Reviews from other years are dropped as they stream past
+    return filter_year(parse_reviews(html))
+
+
+def scrape_reviews():
+    """Main function to scrape reviews in a fresh browser - only 2023 reviews"""
+    return run_in_browser(fetch_reviews)
 
 
 def save_reviews(reviews, filepath):
-    """Save reviews to JSON file"""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(reviews, f, indent=2, ensure_ascii=False)
-    print(f"Saved {len(reviews)} reviews to {filepath}")
+    """Stream reviews to a JSON file and return how many were saved"""
+    if reviews is None:
+        print(f"Scraping failed - keeping existing {filepath}")
+        return 0
+    
+    count = write_json_array(reviews, filepath)
+    print(f"Saved {count} reviews to {filepath}")
+    return count
 
 
 if __name__ == "__main__":
@@ -173,6 +229,10 @@ if __name__ == "__main__":
     data_dir = os.path.join(os.path.dirname(script_dir), 'data')
     
     reviews = scrape_reviews()
+    if reviews is None:
+        sys.exit("Scraping failed - existing reviews.json left untouched")
+    
+    reviews = list(reviews)  # Kept in memory for the per-month stats below
     save_reviews(reviews, os.path.join(data_dir, 'reviews.json'))
     
     print(f"\nTOTAL REVIEWS EXTRACTED: {len(reviews)}")
@@ -0,0 +1,54 @@
+"""
+Run all three scrapers concurrently and save their results.
+Reviews and testimonials are scraped in two pages of one shared headless
+browser while the products pages are fetched over plain HTTP, all on a
+single asyncio event loop. Each scraper hands back a generator, so results
+are parsed and streamed to disk one item at a time.
+
+Usage:
+    python scraper/run_all.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.browser import browser_context
+from scraper.products_scraper import fetch_products, save_products
+from scraper.reviews_scraper import fetch_reviews, save_reviews
+from scraper.testimonials_scraper import fetch_testimonials, save_testimonials
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+
+
+async def scrape_all():
+    """Scrape products, reviews and testimonials concurrently"""
+    async with browser_context() as context:
+        return await asyncio.gather(
+            fetch_products(),
+            fetch_reviews(context),
+            fetch_testimonials(context)
+        )
+
+
+def run_all():
+    """Run all scrapers and save their results"""
+    products, reviews, testimonials = asyncio.run(scrape_all())
+    
+    num_products = save_products(products, os.path.join(DATA_DIR, 'products.json'))
+    num_reviews = save_reviews(reviews, os.path.join(DATA_DIR, 'reviews.json'))
+    num_testimonials = save_testimonials(testimonials, os.path.join(DATA_DIR, 'testimonials.json'))
+    
+    print(f"\n{'='*50}")
+    print(f"TOTAL PRODUCTS EXTRACTED: {num_products}")
+    print(f"TOTAL REVIEWS EXTRACTED: {num_reviews}")
+    print(f"TOTAL TESTIMONIALS EXTRACTED: {num_testimonials}")
+    print(f"{'='*50}")
+
+
+if __name__ == "__main__":
+    run_all()
@@ -1,145 +1,174 @@
 """
-Testimonials scraper for web-scraping.dev using Selenium
+Testimonials scraper for web-scraping.dev using Playwright
 Scrapes testimonials from /testimonials page with infinite scroll
+Testimonials are yielded lazily and streamed straight to disk by save_testimonials
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-import json
-import time
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser
 import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.browser import WAIT_UNTIL, run_in_browser
+from scraper.output import write_json_array
 
 BASE_URL = "https://web-scraping.dev"
 TESTIMONIALS_URL = f"{BASE_URL}/testimonials"
 
+# Counts testimonials added to the page so the scroll loop can wait for new
+# ones to arrive instead of polling the page height. Only .testimonial
+# elements count (directly or inside an added wrapper), so text nodes and
+# loading indicators don't end the wait early.
+OBSERVE_NEW_ITEMS_JS = """
+() => {
+    window._newItems = 0;
+    new MutationObserver(mutations => {
+        for (const m of mutations) {
+            for (const node of m.addedNodes) {
+                if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                window._newItems += node.matches('.testimonial')
+                    ? 1 : node.querySelectorAll('.testimonial').length;
+            }
+        }
+    }).observe(document.body, {childList: true, subtree: true});
+}
+"""
+
 
-def get_driver():
-    """Create and return a Chrome WebDriver instance"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in headless mode
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
+def extract_testimonials(html):
+    """
+    Yield the raw fields of every testimonial in the page HTML, trying
+    alternative selectors when the usual ones are missing.
+    Parsing happens locally, so the browser is only asked for the HTML once.
+    """
+    tree = LexborHTMLParser(html)
+    testimonial_nodes = tree.css(".testimonial") or tree.css("[class*='testimonial']")
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+    for testimonial_node in testimonial_nodes:
+        text_node = testimonial_node.css_first(".text, p.text")
+        author_node = testimonial_node.css_first(".author, .testimonial-author")
+        
+        if text_node:
+            text = text_node.text().strip()
+        else:
+            # Whole-node fallback: separate the nested blocks (text, author) so words don't run together
+            text = testimonial_node.text(separator=" ", strip=True)
+        
+        yield {
+            "text": text,
+            "author": author_node.text().strip() if author_node else "Anonymous",
+            "stars": len(testimonial_node.css(".rating svg"))
+        }
 
 
-def scrape_testimonials_selenium():
-    """Scrape testimonials from web-scraping.dev/testimonials using Selenium"""
-    all_testimonials = []
-    driver = get_driver()
+async def scrape_testimonials_playwright(context):
+    """
+    Load every testimonial on web-scraping.dev/testimonials in a new page of the
+    given browser context and return a snapshot of the page HTML.
+    """
+    page = await context.new_page()
     
     try:
         print("Navigating to testimonials page...")
-        driver.get(TESTIMONIALS_URL)
+        await page.goto(TESTIMONIALS_URL, wait_until=WAIT_UNTIL)
         
         # Wait for testimonials to load
-        time.sleep(2)
+        try:
+            await page.wait_for_selector("[class*='testimonial']", timeout=10000)
+        except PlaywrightTimeoutError:
+            print("No testimonials appeared on the page")
         
         # Handle infinite scroll - scroll down multiple times to load more
-        last_height = driver.execute_script("return document.body.scrollHeight")
+        await page.evaluate(OBSERVE_NEW_ITEMS_JS)
         max_scrolls = 5  # Limit scrolls
         scroll_count = 0
         
         while scroll_count < max_scrolls:
-            # Scroll down
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1.5)  # Wait for content to load
+            # Reset the new-testimonial counter and scroll down
+            await page.evaluate("window._newItems = 0; window.scrollTo(0, document.body.scrollHeight)")
             
-            # Check if we've reached the bottom
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
+            # Resolve as soon as new testimonials are added; none means we're at the bottom
+            try:
+                await page.wait_for_function("window._newItems > 0", timeout=3000)
+            except PlaywrightTimeoutError:
                 print("Reached bottom of page")
                 break
             
-            last_height = new_height
             scroll_count += 1
             print(f"Scrolled {scroll_count} times")
         
-        # Extract testimonials
-        print("Extracting testimonials...")
-        
-        # Try different selectors for testimonials
-        testimonial_elements = driver.find_elements(By.CSS_SELECTOR, ".testimonial")
-        
-        if not testimonial_elements:
-            # Try alternative selectors
-            testimonial_elements = driver.find_elements(By.CSS_SELECTOR, "[class*='testimonial']")
-        
-        print(f"Found {len(testimonial_elements)} testimonial elements")
-        
-        for testimonial_elem in testimonial_elements:
-            try:
-                # Try to find the text element
-                try:
-                    text_elem = testimonial_elem.find_element(By.CSS_SELECTOR, ".text, p.text")
-                    text = text_elem.text.strip()
-                except NoSuchElementException:
-                    # Fallback to full text
-                    text = testimonial_elem.text.strip()
-                
-                if not text:
-                    continue
-                
-                author = "Anonymous"
-                
-                # Try to find author element
-                try:
-                    author_elem = testimonial_elem.find_element(By.CSS_SELECTOR, ".author, .testimonial-author")
-                    author = author_elem.text.strip()
-                except NoSuchElementException:
-                    pass
-                
-                # Count stars - look for SVG elements in the .rating span
-                star_svgs = testimonial_elem.find_elements(By.CSS_SELECTOR, ".rating svg")
-                rating = len(star_svgs) if star_svgs else 5
+        # Take a single snapshot of the page HTML; testimonials are parsed from it locally
+        return await page.content()
                 
-                if text and len(text) > 5:
-                    testimonial = {
-                        "text": text,
-                        "author": author,
-                        "rating": rating
-                    }
-                    all_testimonials.append(testimonial)
-                    
-            except Exception as e:
-                print(f"Error parsing testimonial: {e}")
+    finally:
+        await page.close()
+
+
+def parse_testimonials(html):
+    """Yield a testimonial dict for every testimonial element with meaningful text"""
+    found = 0
+    kept = 0
+    
+    for item in extract_testimonials(html):
+        found += 1
+        try:
+            text = item["text"]
+            
+            if not text:
                 continue
+            
+            author = item["author"]
+            
+            # Star SVGs counted in extract_testimonials
+            rating = item["stars"] or 5
+            
+            if text and len(text) > 5:
+                kept += 1
+                yield {
+                    "text": text,
+                    "author": author,
+                    "rating": rating
+                }
                 
-    finally:
-        driver.quit()
+        except Exception as e:
+            print(f"Error parsing testimonial: {e}")
+            continue
     
-    return all_testimonials
+    print(f"Found {found} testimonial elements")
+    print(f"Scraped {kept} testimonials using Playwright")
 
 
-def scrape_testimonials():
-    """Main function to scrape testimonials using Selenium"""
-    testimonials = []
-    
+async def fetch_testimonials(context):
+    """
+    Scrape testimonials in the given browser context and return a generator of
+    them, or None if scraping failed
+    """
     try:
-        testimonials = scrape_testimonials_selenium()
-        print(f"Scraped {len(testimonials)} testimonials using Selenium")
+        html = await scrape_testimonials_playwright(context)
     except Exception as e:
-        print(f"Selenium scraping failed: {e}")
+        print(f"Playwright scraping failed: {e}")
+        return None
     
-    return testimonials
+    return parse_testimonials(html)
+
+
+def scrape_testimonials():
+    """Main function to scrape testimonials in a fresh browser"""
+    return run_in_browser(fetch_testimonials)
 
 
 def save_testimonials(testimonials, filepath):
-    """Save testimonials to JSON file"""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(testimonials, f, indent=2, ensure_ascii=False)
-    print(f"Saved {len(testimonials)} testimonials to {filepath}")
+    """Stream testimonials to a JSON file and return how many were saved"""
+    if testimonials is None:
+        print(f"Scraping failed - keeping existing {filepath}")
+        return 0
+    
+    count = write_json_array(testimonials, filepath)
+    print(f"Saved {count} testimonials to {filepath}")
+    return count
 
 
 if __name__ == "__main__":
@@ -147,11 +176,10 @@ if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
     data_dir = os.path.join(os.path.dirname(script_dir), 'data')
     
-    testimonials = scrape_testimonials()
-    save_testimonials(testimonials, os.path.join(data_dir, 'testimonials.json'))
+    num_testimonials = save_testimonials(scrape_testimonials(), os.path.join(data_dir, 'testimonials.json'))
     
-    print(f"\nTOTAL TESTIMONIALS EXTRACTED: {len(testimonials)}")
+    print(f"\nTOTAL TESTIMONIALS EXTRACTED: {num_testimonials}")
     
     print(f"\n{'='*50}")
-    print(f"TOTAL TESTIMONIALS EXTRACTED: {len(testimonials)}")
+    print(f"TOTAL TESTIMONIALS EXTRACTED: {num_testimonials}")
     print(f"{'='*50}")